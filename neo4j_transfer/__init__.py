@@ -1,6 +1,19 @@
 from neo4j_transfer.models import Neo4jCredentials, TransferSpec
-from neo4j_transfer.n4j import validate_credentials, execute_query
+from neo4j_transfer.n4j import (
+    validate_credentials,
+    execute_query,
+    execute_query_stream,
+    execute_write_batches,
+    execute_query_stream_async,
+    get_async_driver,
+    reset_database,
+    run_query,
+)
 from neo4j_transfer._logger import logger
+from neo4j_transfer._pipeline import prefetched
+from neo4j_transfer._batching import AdaptiveBatcher
+from neo4j_transfer._cypher import safe_label
+import logging
 import neo4j_transfer.errors as errors_
 from neo4j_uploader import batch_upload, batch_upload_generator
 from neo4j_uploader.models import (
@@ -9,8 +22,16 @@ from neo4j_uploader.models import (
     Nodes,
     Neo4jConfig,
     GraphData,
+    UploadResult,
 )
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, groupby, islice
+from operator import itemgetter
 from datetime import datetime
+import asyncio
+import time
 
 
 def transfer(
@@ -34,10 +55,11 @@ def transfer(
     validate_credentials(source_creds)
     validate_credentials(target_creds)
 
-    nodes = get_nodes(source_creds, spec)
-    rels = get_relationships(source_creds, spec)
+    # Stream batches straight to the target so only spec.batch_size records are held at a time
+    nodes = iter_nodes(source_creds, spec)
+    rels = iter_relationships(source_creds, spec)
 
-    result = upload(
+    result = _upload_stream(
         target_creds,
         nodes,
         rels,
@@ -68,8 +90,12 @@ def transfer_generator(
     validate_credentials(source_creds)
     validate_credentials(target_creds)
 
-    nodes = get_nodes(source_creds, spec)
-    rels = get_relationships(source_creds, spec)
+    # Node and Relationship source reads are independent, overlap their round-trips
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        nodes_future = executor.submit(get_nodes, source_creds, spec)
+        rels_future = executor.submit(get_relationships, source_creds, spec)
+        nodes = nodes_future.result()
+        rels = rels_future.result()
 
     return upload_generator(
         target_creds,
@@ -79,17 +105,153 @@ def transfer_generator(
     )
 
 
+async def transfer_async(
+    source_creds: Neo4jCredentials,
+    target_creds: Neo4jCredentials,
+    spec: TransferSpec,
+) -> UploadResult:
+    """Transfer data from one Neo4j instance to another with the async driver.
+
+    Source reads and target writes run concurrently on one event loop, with at most two batches waiting between them.
+    Batches start at spec.batch_size records and are resized from the observed write latency.
+
+    Args:
+        source_creds (Neo4jCredentials): Credentials for the source Neo4j instance
+
+        target_creds (Neo4jCredentials): Credentials for the target Neo4j instance
+
+        spec (TransferSpec): Specification for the data transfer
+
+    Returns:
+        UploadResult: UploadResult object with the combined counters of every batch.
+    """
+
+    source = get_async_driver(source_creds)
+    target = get_async_driver(target_creds)
+    try:
+        await asyncio.gather(source.verify_connectivity(), target.verify_connectivity())
+
+        # Schema setup reuses the blocking helpers, it runs once before any batch is written
+        if spec.overwrite_target:
+            await asyncio.to_thread(reset_database, target_creds)
+        for label in spec.node_labels:
+            await asyncio.to_thread(
+                _create_index, target_creds, label, spec.element_id_key
+            )
+
+        result = UploadResult(started_at=datetime.now(), records_total=0)
+        queue = asyncio.Queue(maxsize=2)
+        batcher = AdaptiveBatcher(spec.batch_size)
+
+        async def read():
+            try:
+                async for batch in _iter_batches_async(
+                    source, source_creds, spec, batcher
+                ):
+                    result.records_total += 1
+                    await queue.put(batch)
+            finally:
+                await queue.put(None)
+
+        async def write():
+            # Nodes are queued before relationships, so every endpoint exists before it is matched
+            while (batch := await queue.get()) is not None:
+                if isinstance(batch, Nodes):
+                    query, rows = _node_upload_query(batch), _node_rows(batch)
+                else:
+                    query, rows = _relationship_upload_query(batch), batch.records
+                started = time.perf_counter()
+                try:
+                    summary = (
+                        await target.execute_query(
+                            query, {"rows": rows}, database=target_creds.database
+                        )
+                    ).summary
+                    batcher.record(time.perf_counter() - started)
+                except Exception as e:
+                    result.error_message += f"Error processing batch {result.records_completed} of {result.records_total}: {e}."
+                    continue
+                result.nodes_created += summary.counters.nodes_created
+                result.relationships_created += summary.counters.relationships_created
+                result.properties_set += summary.counters.properties_set
+                result.records_completed += 1
+
+        await asyncio.gather(read(), write())
+    finally:
+        await asyncio.gather(source.close(), target.close())
+
+    result.finished_at = datetime.now()
+    result.seconds_to_complete = (
+        result.finished_at - result.started_at
+    ).total_seconds()
+    result.was_successful = result.error_message == ""
+    return result
+
+
+async def _iter_batches_async(
+    driver, creds: Neo4jCredentials, spec: TransferSpec, batcher: AdaptiveBatcher
+) -> AsyncGenerator[Nodes | Relationships, None]:
+    """Stream Uploader Nodes then Relationships Specs of up to batcher.size records each from source with the async driver"""
+
+    key = spec.element_id_key
+    params = spec.query_params
+
+    for label, query in spec.node_queries:
+        records = []
+        async for (record,) in execute_query_stream_async(
+            driver, creds, query, params, fetch_size=spec.page_size
+        ):
+            records.append(record)
+            if len(records) >= batcher.size:
+                yield Nodes(labels=[label], key=key, records=records)
+                records = []
+        if records:
+            yield Nodes(labels=[label], key=key, records=records)
+
+    if not spec.node_labels:
+        return
+
+    batches = _RelationshipBatches(spec)
+
+    for type, query in spec.relationship_queries:
+        async for from_label, to_label, record in execute_query_stream_async(
+            driver, creds, query, params, fetch_size=spec.page_size
+        ):
+            rels_spec = batches.add(type, from_label, to_label, record, batcher.size)
+            if rels_spec is not None:
+                yield rels_spec
+        for rels_spec in batches.flush(type):
+            yield rels_spec
+
+
 def undo(creds: Neo4jCredentials, spec: TransferSpec):
 
     timestamp_key = spec.timestamp_key
     ds_string = f"{spec.timestamp.isoformat()}"
+
+    if len(spec.node_labels) > 0:
+        # Look transferred nodes up through a per label index rather than scanning every node
+        for label in spec.node_labels:
+            _create_index(creds, label, timestamp_key)
+        match = " UNION ".join(
+            f"MATCH (n:{safe_label(label)}) WHERE n.{safe_label(timestamp_key)} = $datetime RETURN n"
+            for label in spec.node_labels
+        )
+    else:
+        match = f"MATCH (n) WHERE n.{safe_label(timestamp_key)} = $datetime RETURN n"
+
+    # Delete in server side batches so a large undo never builds one huge transaction
     query = f"""
-    MATCH (n)
-    WHERE n.`{timestamp_key}` = $datetime
-    DETACH DELETE n
+    CALL {{
+        {match}
+    }}
+    CALL {{
+        WITH n
+        DETACH DELETE n
+    }} IN TRANSACTIONS OF 10000 ROWS
     """
     params = {"datetime": ds_string}
-    _, summary, _ = execute_query(creds, query, params)
+    summary = run_query(creds, query, params)
 
     return summary
 
@@ -99,6 +261,7 @@ def upload(
     nodes: list[Nodes],
     relationships: list[Relationships],
     overwrite: bool = False,
+    max_workers: int = 8,
 ):
     """Upload the data to the target Neo4j instance
 
@@ -108,22 +271,73 @@ def upload(
         nodes (list[Nodes]): List of Nodes to upload
         relationships (list[Relationships]): List of Relationships to upload
         overwrite (bool, optional): Should the target database data be overwritten (deleted prior to upload). Defaults to False.
+        max_workers (int, optional): Maximum number of Nodes or Relationships specs uploaded concurrently. Defaults to 8.
 
     Returns:
         UploadResults: UploadResults object from the Neo4j uploader package.
     """
 
-    n4j_config = Neo4jConfig(
+    nodes, relationships = _non_empty_specs(nodes, relationships)
+
+    # Without an index every MERGE on the node key scans the whole label
+    create_node_indexes(creds, nodes)
+
+    # Clear once up front rather than from within one of the concurrent uploads
+    if overwrite:
+        reset_database(creds)
+
+    # Specs of different labels are independent. Relationships only wait for all nodes to exist
+    result = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for nodes_result in executor.map(
+            lambda nodes_spec: _batch_upload(creds, [nodes_spec], []), nodes
+        ):
+            result = _merge_results(result, nodes_result)
+
+        for rels_result in executor.map(
+            lambda rels_spec: _batch_upload(creds, [], [rels_spec]), relationships
+        ):
+            result = _merge_results(result, rels_result)
+
+    if result is None:
+        result = _empty_result()
+
+    return result
+
+
+def _batch_upload(
+    creds: Neo4jCredentials,
+    nodes: list[Nodes],
+    relationships: list[Relationships],
+) -> UploadResult:
+    """Upload the data with the Neo4j uploader package"""
+
+    n4j_config = _uploader_config(creds)
+    graph_data = GraphData(nodes=nodes, relationships=relationships)
+
+    result = batch_upload(n4j_config, graph_data)
+
+    return result
+
+
+def _uploader_config(creds: Neo4jCredentials) -> Neo4jConfig:
+    """Neo4j uploader config writing to the database of the given credentials"""
+    return Neo4jConfig(
         neo4j_uri=creds.uri,
         neo4j_user=creds.username,
         neo4j_password=creds.password,
-        overwrite=overwrite,
+        neo4j_database=creds.database,
     )
-    graph_data = GraphData(nodes=nodes, relationships=relationships)
 
-    result = batch_upload(n4j_config, graph_data)
 
-    return result
+def _non_empty_specs(
+    nodes: list[Nodes], relationships: list[Relationships]
+) -> tuple[list[Nodes], list[Relationships]]:
+    """Nodes and Relationships specs with records, empty specs would still cost a round-trip each"""
+    return (
+        [nodes_spec for nodes_spec in nodes if nodes_spec.records],
+        [rels_spec for rels_spec in relationships if rels_spec.records],
+    )
 
 
 def upload_generator(
@@ -145,147 +359,544 @@ def upload_generator(
         UploadResults: Generator of UploadResults object from the Neo4j uploader package.
     """
 
-    n4j_config = Neo4jConfig(
-        neo4j_uri=creds.uri,
-        neo4j_user=creds.username,
-        neo4j_password=creds.password,
-        overwrite=overwrite,
-    )
+    nodes, relationships = _non_empty_specs(nodes, relationships)
+
+    n4j_config = _uploader_config(creds)
     graph_data = GraphData(nodes=nodes, relationships=relationships)
 
-    result = batch_upload_generator(n4j_config, graph_data)
+    # Nothing touches the target until the first result is requested
+    def generate():
+        # Without an index every MERGE on the node key scans the whole label
+        create_node_indexes(creds, nodes)
 
+        if overwrite:
+            reset_database(creds)
+
+        yield from batch_upload_generator(n4j_config, graph_data)
+
+    return generate()
+
+
+def upload_native(
+    creds: Neo4jCredentials,
+    nodes: list[Nodes],
+    relationships: list[Relationships],
+    overwrite: bool = False,
+    batch_size: int = 1_000,
+    max_workers: int = 8,
+    payload_size: int = 10_000,
+) -> UploadResult:
+    """Upload the data to the target Neo4j instance with batched UNWIND + MERGE queries, bypassing the Neo4j uploader package.
+
+    Args:
+        creds (Neo4jCredentials): Neo4j Credentials object for the target Neo4j instance
+
+        nodes (list[Nodes]): List of Nodes to upload
+        relationships (list[Relationships]): List of Relationships to upload
+        overwrite (bool, optional): Should the target database data be overwritten (deleted prior to upload). Defaults to False.
+        batch_size (int, optional): Number of records sent per relationship query, node payloads are committed server side in transactions of this many rows. Defaults to 1000.
+        max_workers (int, optional): Maximum number of concurrent write queries. Defaults to 8.
+        payload_size (int, optional): Number of node records sent per query, and of relationship records committed per write transaction, consecutive relationship batches of a worker share one transaction up to this size. Defaults to 10000.
+
+    Returns:
+        UploadResult: UploadResult object with the combined counters of every batch.
+
+    Raises:
+        ValueError: If batch_size or max_workers is less than 1.
+    """
+
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    nodes, relationships = _non_empty_specs(nodes, relationships)
+
+    # Every payload and batch carries its 1 based index, so a failure reports which one it was
+    indexes = count(1)
+
+    # One list of payloads per Nodes spec, labels never collide so each spec gets its own worker
+    node_batches = []
+    for nodes_spec in nodes:
+        query = _node_upload_query(nodes_spec, in_transactions=True)
+        rows = _node_rows(nodes_spec)
+        node_batches.append(
+            [
+                (next(indexes), query, chunk)
+                for chunk in _chunked(rows, max(payload_size, batch_size))
+            ]
+        )
+
+    # Partition relationships by start node, one partition per worker, so concurrent writers never lock the same start node
+    rel_partitions = [[] for _ in range(max_workers)]
+    for rels_spec in relationships:
+        query = _relationship_upload_query(rels_spec)
+        from_key = rels_spec.from_node.record_key
+        bins = [[] for _ in range(max_workers)]
+        for row in rels_spec.records:
+            bins[hash(row[from_key]) % max_workers].append(row)
+        for partition, bin in zip(rel_partitions, bins):
+            partition.extend(
+                (next(indexes), query, chunk) for chunk in _chunked(bin, batch_size)
+            )
+
+    records_total = sum(len(batches) for batches in node_batches) + sum(
+        len(batches) for batches in rel_partitions
+    )
+    result = UploadResult(started_at=datetime.now(), records_total=records_total)
+
+    if overwrite:
+        reset_database(creds)
+
+    def write_payloads(payloads: list[tuple[int, str, list[dict]]]) -> list:
+        # CALL { ... } IN TRANSACTIONS needs an auto-commit transaction. Sub-transactions committed before a failure stay committed
+        outcomes = []
+        for index, query, rows in payloads:
+            try:
+                summary = run_query(
+                    creds, query, {"rows": rows, "batch_size": batch_size}
+                )
+                outcomes.append((index, summary))
+            except Exception as e:
+                outcomes.append((index, e))
+        return outcomes
+
+    batches_per_transaction = max(1, payload_size // batch_size)
+
+    def write_batches(batches: list[tuple[int, str, list[dict]]]) -> list:
+        # Each worker owns a disjoint start node partition, so its consecutive batches can share one managed transaction.
+        # A failed transaction rolls back every batch in it, so each of them is recorded as failed
+        outcomes = []
+        for group in _chunked(batches, batches_per_transaction):
+            try:
+                summaries = execute_write_batches(
+                    creds, [(query, {"rows": rows}) for _, query, rows in group]
+                )
+                outcomes.extend(
+                    (index, summary) for (index, _, _), summary in zip(group, summaries)
+                )
+            except Exception as e:
+                outcomes.extend((index, e) for index, _, _ in group)
+        return outcomes
+
+    def record(outcomes: list):
+        for index, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                result.error_message += (
+                    f"Error processing batch {index} of {records_total}: {outcome}."
+                )
+                continue
+            result.nodes_created += outcome.counters.nodes_created
+            result.relationships_created += outcome.counters.relationships_created
+            result.properties_set += outcome.counters.properties_set
+            result.records_completed += 1
+
+    # Index the merge keys first so each MERGE is a lookup rather than a label scan
+    create_node_indexes(creds, nodes)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for outcomes in executor.map(write_payloads, node_batches):
+            record(outcomes)
+
+        # Each worker writes its own partition batch by batch, independently of the others
+        for outcomes in executor.map(write_batches, rel_partitions):
+            record(outcomes)
+
+    result.finished_at = datetime.now()
+    result.seconds_to_complete = (
+        result.finished_at - result.started_at
+    ).total_seconds()
+    result.was_successful = result.error_message == ""
     return result
 
 
-def get_node_dicts(creds: Neo4jCredentials, spec: TransferSpec) -> list[dict]:
-    """Retrieve Nodes and convert to a list of dicts from source"""
-    result = []
-    for label in spec.node_labels:
+def create_node_indexes(creds: Neo4jCredentials, nodes: list[Nodes]):
+    """Create a range index for the unique key of every label in a list of Nodes specs, if missing"""
+    indexes = {
+        (label, nodes_spec.key) for nodes_spec in nodes for label in nodes_spec.labels
+    }
+    for label, key in indexes:
+        _create_index(creds, label, key)
 
-        nodes_query = f"""
-            MATCH (n:`{label}`)
-            RETURN n
-            """
-        records, _, _ = execute_query(creds, nodes_query)
 
-        logger.info(f"\n Number of {label} nodes: {len(records)}")
-        if len(records) > 0:
-            logger.info(f"\n First Node: {records[0]}")
+def _create_index(creds: Neo4jCredentials, label: str, key: str):
+    """Create a range index on a label's property key, if missing"""
+    query = f"CREATE RANGE INDEX IF NOT EXISTS FOR (n:{safe_label(label)}) ON (n.{safe_label(key)})"
+    execute_query(creds, query)
 
-        converted_records = []
-        for n in records:
-            node_raw = n.data()["n"]
-            converted_records.append(node_raw)
 
-        result.extend(converted_records)
+def _node_upload_query(nodes_spec: Nodes, in_transactions: bool = False) -> str:
+    """UNWIND query writing a batch of $rows for a Nodes spec.
+
+    With in_transactions the server commits the rows in transactions of $batch_size rows, the query must then run in an auto-commit transaction.
+    """
+    labels = "".join(f":{safe_label(label)}" for label in nodes_spec.labels)
+    key = nodes_spec.key
+    if nodes_spec.dedupe:
+        create = f"MERGE (n{labels} {{{safe_label(key)}: row.{safe_label(key)}}})"
+    else:
+        create = f"CREATE (n{labels})"
+    if in_transactions:
+        return f"""
+        UNWIND $rows AS row
+        CALL {{
+            WITH row
+            {create}
+            SET n += row
+        }} IN TRANSACTIONS OF $batch_size ROWS
+        """
+    return f"""
+        UNWIND $rows AS row
+        {create}
+        SET n += row
+        """
+
+
+def _node_rows(nodes_spec: Nodes) -> list[dict]:
+    """Records of a Nodes spec without its excluded keys"""
+    if not nodes_spec.exclude_keys:
+        return nodes_spec.records
+    excluded = set(nodes_spec.exclude_keys)
+    return [
+        {k: v for k, v in record.items() if k not in excluded}
+        for record in nodes_spec.records
+    ]
+
+
+def _relationship_upload_query(rels_spec: Relationships) -> str:
+    """UNWIND query writing a batch of raw record $rows for a Relationships spec.
+
+    Endpoints are matched on the record keys and excluded keys are dropped server side, so records are sent as is.
+    Unlike the Neo4j uploader, exclude_keys still apply when auto_exclude_keys also drops the endpoint record keys.
+    """
+    from_node = rels_spec.from_node
+    to_node = rels_spec.to_node
+    from_label = f":{safe_label(from_node.node_label)}" if from_node.node_label else ""
+    to_label = f":{safe_label(to_node.node_label)}" if to_node.node_label else ""
+    create = "MERGE" if rels_spec.dedupe else "CREATE"
+
+    excluded = list(dict.fromkeys(rels_spec.exclude_keys))
+    if rels_spec.auto_exclude_keys:
+        excluded.extend(
+            k for k in (from_node.record_key, to_node.record_key) if k not in excluded
+        )
+    # Null entries in a += map are not written
+    properties = "row"
+    if excluded:
+        properties = (
+            f"row{{.*, {', '.join(f'{safe_label(k)}: null' for k in excluded)}}}"
+        )
+
+    return f"""
+        UNWIND $rows AS row
+        MATCH (a{from_label} {{{safe_label(from_node.node_key)}: row.{safe_label(from_node.record_key)}}})
+        MATCH (b{to_label} {{{safe_label(to_node.node_key)}: row.{safe_label(to_node.record_key)}}})
+        {create} (a)-[r:{safe_label(rels_spec.type)}]->(b)
+        SET r += {properties}
+        """
+
+
+def _upload_stream(
+    creds: Neo4jCredentials,
+    nodes: Iterable[Nodes],
+    relationships: Iterable[Relationships],
+    overwrite: bool = False,
+) -> UploadResult:
+    """Upload each Nodes then each Relationships spec as it arrives and combine the results"""
+
+    if overwrite:
+        reset_database(creds)
+
+    result = None
+    indexed = set()
+    # Read the next batch from source while the current one uploads
+    for nodes_spec in prefetched(nodes):
+        if not nodes_spec.records:
+            continue
+
+        # Index each label's key once, not for every batch
+        index_key = (tuple(nodes_spec.labels), nodes_spec.key)
+        if index_key not in indexed:
+            create_node_indexes(creds, [nodes_spec])
+            indexed.add(index_key)
+
+        result = _merge_results(result, _batch_upload(creds, [nodes_spec], []))
+
+    for rels_spec in prefetched(relationships):
+        if not rels_spec.records:
+            continue
+        result = _merge_results(result, _batch_upload(creds, [], [rels_spec]))
+
+    if result is None:
+        result = _empty_result()
+
     return result
 
 
-def get_nodes(creds: Neo4jCredentials, spec: TransferSpec) -> list[Nodes]:
-    """Retrieve Nodes and convert to a list of Uploader Nodes Spec from source and format for uploading"""
+def _empty_result() -> UploadResult:
+    """Completed UploadResult for an upload with nothing to write, without a round-trip to the target"""
+    now = datetime.now()
+    return UploadResult(
+        started_at=now,
+        finished_at=now,
+        records_total=0,
+        seconds_to_complete=0,
+        was_successful=True,
+    )
+
+
+def _merge_results(total: UploadResult | None, result: UploadResult) -> UploadResult:
+    """Fold an UploadResult into a running total"""
+    if total is None:
+        return result
+
+    total.records_total += result.records_total
+    total.records_completed += result.records_completed
+    total.nodes_created += result.nodes_created
+    total.relationships_created += result.relationships_created
+    total.properties_set += result.properties_set
+    total.error_message += result.error_message
+    total.was_successful = total.was_successful and result.was_successful
+    total.finished_at = result.finished_at
+    total.seconds_to_complete = (total.finished_at - total.started_at).total_seconds()
+    return total
+
+
+def _chunked(iterable: Iterable, size: int) -> Generator[list, None, None]:
+    """Yield lists of up to size items from an iterable"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _count(creds: Neo4jCredentials, query: str) -> int:
+    """Return the single value of a count query"""
+    records, _, _ = execute_query(creds, query)
+    return records[0][0]
 
-    # Get nodes and convert to upload format
+
+def get_node_dicts(creds: Neo4jCredentials, spec: TransferSpec) -> list[dict]:
+    """Retrieve Nodes and convert to a list of dicts from source"""
     result = []
-    for label in spec.node_labels:
-
-        nodes_query = f"""
-            MATCH (n:`{label}`)
-            RETURN n
-            """
-        records, _, _ = execute_query(creds, nodes_query)
-
-        logger.info(f"\n Number of {label} nodes: {len(records)}")
-        if len(records) > 0:
-            logger.info(f"\n First Node: {records[0]}")
-
-        converted_records = []
-        for n in records:
-            node_raw = n.data()["n"]
-
-            # Copy to editable dict
-            node = dict(**node_raw)
-
-            if spec.should_append_data:
-                # Get original element id if specified in transfer spec
-                element_id = n.values()[0].element_id
-
-                # Add default transfer related data
-                node.update(
-                    {
-                        spec.element_id_key: element_id,
-                        spec.timestamp_key: spec.timestamp.isoformat(),
-                    }
-                )
+    if len(spec.node_labels) == 0:
+        return result
+
+    # Fetch every label in a single round-trip. A label listed twice is fetched once
+    labels = list(dict.fromkeys(spec.node_labels))
+    nodes_query = " UNION ALL ".join(
+        f"MATCH (n:{safe_label(label)}) RETURN $labels[{index}] AS label, properties(n) AS properties"
+        for index, label in enumerate(labels)
+    )
+    records, _, _ = execute_query(creds, nodes_query, {"labels": labels})
 
-            converted_records.append(node)
+    # UNION ALL returns each label's rows contiguously, so they group without a per row dict lookup.
+    # Records are tuples, positional access skips the key resolution of record["label"]
+    records_by_label = {}
+    for label, label_records in groupby(records, key=itemgetter(0)):
+        records_by_label.setdefault(label, []).extend(label_records)
 
-        nodes_spec = Nodes(
-            labels=[label], key=spec.element_id_key, records=converted_records
-        )
+    for label in labels:
+        label_records = records_by_label.get(label, [])
 
-        result.append(nodes_spec)
+        logger.info(f"\n Number of {label} nodes: {len(label_records)}")
+        if len(label_records) > 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"\n First Node: {label_records[0]}")
 
+        # Property maps arrive as plain dicts, no per record data() copy needed
+        converted_records = [properties for _, properties in label_records]
+
+        result.extend(converted_records)
     return result
 
 
-def get_relationships(
+def _iter_nodes(
+    creds: Neo4jCredentials,
+    label: str,
+    nodes_query: str,
+    params: dict,
+    fetch_size: int = 10_000,
+) -> Generator[dict, None, None]:
+    """Yield upload ready node records of a single label from source"""
+
+    # Label counts come from the count store, skip empty labels without scanning them
+    count = _count(creds, f"MATCH (n:{safe_label(label)}) RETURN count(n)")
+    logger.info(f"\n Number of {label} nodes: {count}")
+    if count == 0:
+        return
+
+    # Stream over a single cursor, the driver only holds one fetch of records at a time
+    first = True
+    for n in execute_query_stream(creds, nodes_query, params, fetch_size=fetch_size):
+        if first and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"\n First Node: {n}")
+        first = False
+
+        yield n[0]
+
+
+def iter_nodes(
     creds: Neo4jCredentials, spec: TransferSpec
-) -> list[Relationships]:
-    """Retrieve Relationships from source and format for uploading"""
+) -> Generator[Nodes, None, None]:
+    """Stream Nodes from source as Uploader Nodes Specs of up to spec.batch_size records each"""
 
-    result = []
-    for type in spec.relationship_types:
-        query = """
-            MATCH (n)-[r]->(n2)
-            WHERE any(label IN labels(n) WHERE label IN $labels) AND any(label IN labels(n2) WHERE label IN $labels) AND type(r) in $types
-            RETURN n, r, n2
-        """
-        params = {"labels": spec.node_labels, "types": [type]}
-        records, _, _ = execute_query(creds, query, params)
+    key = spec.element_id_key
 
-        source_node = TargetNode(
-            node_label=None,
-            node_key=spec.element_id_key,
-            record_key=f"_from_{spec.element_id_key}",
+    for label, query in spec.node_queries:
+        records = _iter_nodes(
+            creds, label, query, spec.query_params, fetch_size=spec.page_size
         )
-        target_node = TargetNode(
-            node_label=None,
-            node_key=spec.element_id_key,
-            record_key=f"_to_{spec.element_id_key}",
+        for chunk in _chunked(records, spec.batch_size):
+            yield Nodes(labels=[label], key=key, records=chunk)
+
+
+def get_nodes(creds: Neo4jCredentials, spec: TransferSpec) -> list[Nodes]:
+    """Retrieve Nodes and convert to a list of Uploader Nodes Spec from source and format for uploading"""
+
+    key = spec.element_id_key
+
+    def get_label_nodes(label_query: tuple[str, str]) -> Nodes:
+        label, query = label_query
+        converted_records = list(
+            _iter_nodes(creds, label, query, spec.query_params, spec.page_size)
         )
+        return Nodes(labels=[label], key=key, records=converted_records)
 
-        converted_records = []
-        for rec in records:
-            from_eid = rec.values()[0].element_id
-            to_eid = rec.values()[2].element_id
-            r_eid = rec.values()[1].element_id
-
-            # TODO: Relationship properties
-
-            # Required data to connect relationships with source and target nodes
-            rel_rec = {
-                f"_from_{spec.element_id_key}": from_eid,
-                f"_to_{spec.element_id_key}": to_eid,
-            }
-
-            if spec.should_append_data:
-                # Add default transfer related data
-                rel_rec.update(
-                    {
-                        spec.element_id_key: r_eid,
-                        spec.timestamp_key: spec.timestamp.isoformat(),
-                    }
-                )
-            converted_records.append(rel_rec)
+    # Get nodes and convert to upload format, one concurrent query per label
+    with ThreadPoolExecutor(max_workers=spec.max_workers) as executor:
+        result = list(executor.map(get_label_nodes, spec.node_queries))
 
-        rels_spec = Relationships(
+    return result
+
+
+def _has_relationships(creds: Neo4jCredentials, type: str) -> bool:
+    """Whether the source has relationships of a type, from the count store without matching them"""
+    return _count(creds, f"MATCH ()-[r:{safe_label(type)}]->() RETURN count(r)") > 0
+
+
+def _endpoint_nodes(
+    spec: TransferSpec, from_label: str | None = None, to_label: str | None = None
+) -> tuple[TargetNode, TargetNode]:
+    """Source and target TargetNode specs for relationships between the given node labels"""
+    from_key, to_key = spec.endpoint_record_keys
+    source_node = TargetNode(
+        node_label=from_label,
+        node_key=spec.element_id_key,
+        record_key=from_key,
+    )
+    target_node = TargetNode(
+        node_label=to_label,
+        node_key=spec.element_id_key,
+        record_key=to_key,
+    )
+    return source_node, target_node
+
+
+class _RelationshipBatches:
+    """Collects streamed relationship records into Uploader Relationships Specs, one batch per endpoint label pair at a time"""
+
+    def __init__(self, spec: TransferSpec):
+        self.spec = spec
+        self.buffers = defaultdict(list)
+        # Endpoint specs are built once per label pair rather than for every batch
+        self.endpoints = {}
+
+    def relationships(
+        self, type: str, from_label: str, to_label: str, records: list[dict]
+    ) -> Relationships:
+        """Relationships spec of a type between the given node labels"""
+        pair = (from_label, to_label)
+        if pair not in self.endpoints:
+            self.endpoints[pair] = _endpoint_nodes(self.spec, from_label, to_label)
+        source_node, target_node = self.endpoints[pair]
+        return Relationships(
             type=type,
             from_node=source_node,
             to_node=target_node,
-            records=converted_records,
+            records=records,
         )
-        result.append(rels_spec)
+
+    def add(
+        self, type: str, from_label: str, to_label: str, record: dict, batch_size: int
+    ) -> Relationships | None:
+        """Buffer a record, returning its label pair's batch once it holds batch_size records"""
+        pair = (from_label, to_label)
+        buffer = self.buffers[pair]
+        buffer.append(record)
+        if len(buffer) >= batch_size:
+            return self.relationships(
+                type, from_label, to_label, self.buffers.pop(pair)
+            )
+        return None
+
+    def flush(self, type: str) -> list[Relationships]:
+        """Batches of every partially filled label pair, call once a type has been fully streamed"""
+        result = [
+            self.relationships(type, from_label, to_label, records)
+            for (from_label, to_label), records in self.buffers.items()
+        ]
+        self.buffers.clear()
+        return result
+
+
+def iter_relationships(
+    creds: Neo4jCredentials, spec: TransferSpec
+) -> Generator[Relationships, None, None]:
+    """Stream Relationships from source as Uploader Relationships Specs of up to spec.batch_size records each"""
+
+    # Only relationships between transferred labels are matched, without labels there are none
+    if not spec.node_labels:
+        return
+
+    params = spec.query_params
+    batch_size = spec.batch_size
+    batches = _RelationshipBatches(spec)
+
+    for type, query in spec.relationship_queries:
+        if not _has_relationships(creds, type):
+            continue
+
+        for from_label, to_label, record in execute_query_stream(
+            creds, query, params, fetch_size=spec.page_size
+        ):
+            rels_spec = batches.add(type, from_label, to_label, record, batch_size)
+            if rels_spec is not None:
+                yield rels_spec
+        yield from batches.flush(type)
+
+
+def get_relationships(
+    creds: Neo4jCredentials, spec: TransferSpec
+) -> list[Relationships]:
+    """Retrieve Relationships from source and format for uploading"""
+
+    if not spec.node_labels:
+        return []
+
+    params = spec.query_params
+    # Endpoint specs shared by every type with the same label pair
+    batches = _RelationshipBatches(spec)
+
+    def get_type_relationships(type_query: tuple[str, str]) -> list[Relationships]:
+        # One Relationships spec per endpoint label pair
+        type, query = type_query
+        if not _has_relationships(creds, type):
+            return []
+        return [
+            batches.relationships(type, from_label, to_label, records)
+            for from_label, to_label, records in execute_query_stream(
+                creds, query, params, fetch_size=spec.page_size
+            )
+        ]
+
+    # One concurrent query per relationship type
+    with ThreadPoolExecutor(max_workers=spec.max_workers) as executor:
+        result = [
+            rels_spec
+            for type_rels in executor.map(
+                get_type_relationships, spec.relationship_group_queries
+            )
+            for rels_spec in type_rels
+        ]
 
     return result
 
@@ -301,13 +912,14 @@ def get_node_labels(creds: Neo4jCredentials) -> list[str]:
     """
     result = []
     query = """
-        call db.labels();
+        CALL db.labels() YIELD label RETURN label
     """
     response, _, _ = execute_query(creds, query)
 
     logger.debug(f"get_nodes reponse: {response}")
 
-    result = [r.data()["label"] for r in response]
+    # Index the single field by position instead of building a dict per record
+    result = [r[0] for r in response]
 
     logger.info(f"Nodes found: {result}")
     return result
@@ -324,13 +936,13 @@ def get_relationship_types(creds: Neo4jCredentials) -> list[str]:
     """
     result = []
     query = """
-        call db.relationshipTypes();
+        CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType
     """
     response, _, _ = execute_query(creds, query)
 
     logger.debug(f"get_relationships reponse: {response}")
 
-    result = [r.data()["relationshipType"] for r in response]
+    result = [r[0] for r in response]
 
     logger.info("Relationships found: " + str(result))
     return result
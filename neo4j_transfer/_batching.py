@@ -0,0 +1,34 @@
+class AdaptiveBatcher:
+    """Batch size tuned from an exponentially weighted moving average of write latency.
+
+    Grows the size by 20% while writes complete well under the target latency and halves it when they run well over.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        target_ms: float = 2000,
+        min_size: int = 1_000,
+        max_size: int = 200_000,
+        alpha: float = 0.2,
+    ):
+        # An initial size below min_size lowers the floor rather than being overridden
+        self.min_size = min(min_size, size)
+        self.max_size = max(max_size, size)
+        self.size = size
+        self.target_ms = target_ms
+        self.alpha = alpha
+        self.ewma_ms = None
+
+    def record(self, seconds: float):
+        """Fold the latency of one completed write into the average and adjust the size"""
+        ms = seconds * 1000
+        if self.ewma_ms is None:
+            self.ewma_ms = ms
+        else:
+            self.ewma_ms = self.alpha * ms + (1 - self.alpha) * self.ewma_ms
+
+        if self.ewma_ms < self.target_ms * 0.5:
+            self.size = min(self.max_size, max(self.size + 1, int(self.size * 1.2)))
+        elif self.ewma_ms > self.target_ms * 1.5:
+            self.size = max(self.min_size, self.size // 2)
@@ -0,0 +1,10 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def safe_label(name: str) -> str:
+    """Backtick quote a label, relationship type or property key for Cypher, escaping any backticks in it.
+
+    Names come from a small fixed set, so each is only escaped once.
+    """
+    return "`" + name.replace("`", "``") + "`"
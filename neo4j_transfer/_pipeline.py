@@ -0,0 +1,63 @@
+from collections.abc import Generator, Iterable
+import queue
+import threading
+
+
+class _Done:
+    """Marks the end of a prefetched iterable"""
+
+    pass
+
+
+class _Failed:
+    """Carries an exception raised while producing prefetched items"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetched(iterable: Iterable, maxsize: int = 2) -> Generator:
+    """Iterate an iterable from a background thread, keeping up to maxsize items ready ahead of the consumer.
+
+    Lets the source read for the next batch overlap with the target write of the current one.
+    """
+    # Resolve the iterator before the producer starts, so a non iterable raises to the caller
+    iterator = iter(iterable)
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Give up if the consumer went away, rather than block on a full queue forever
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(_Done)
+        except BaseException as e:
+            put(_Failed(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _Done:
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+from neo4j_transfer._cypher import safe_label
 from typing import Optional
 from datetime import datetime
 import os
@@ -18,20 +19,14 @@ class Neo4jCredentials(BaseModel):
         _type_: _description_
     """
 
+    # Frozen models get a generated __hash__ over their fields
+    model_config = ConfigDict(frozen=True)
+
     uri: str
     password: str
     username: Optional[str] = "neo4j"
     database: Optional[str] = "neo4j"
 
-    def __hash__(self):
-        return hash((type(self),) + tuple(self.dict().items()))
-
-    def __xgetstate__(self):
-        return self.__dict__
-
-    def __setstate__(self, state):
-        self.__dict__ = state
-
 
 def generate_id():
     return binascii.hexlify(os.urandom(8)).decode()
@@ -55,8 +50,16 @@ class TransferSpec(BaseModel):
 
         overwrite_target (bool): Should the target database data be overwritten (deleted prior to upload). Defaults to False.
 
+        page_size (int): Number of records fetched from the source database per round-trip while streaming. Defaults to 10000.
+
+        batch_size (int): Number of records per Nodes/Relationships spec streamed to the target database during a transfer. Defaults to 1000.
+
+        max_workers (int): Maximum number of concurrent source queries when retrieving Nodes and Relationships. Defaults to 8.
+
     """
 
+    model_config = ConfigDict(frozen=True)
+
     node_labels: list[str]
     relationship_types: Optional[list[str]] = []
     should_append_data: bool = True
@@ -64,6 +67,96 @@ class TransferSpec(BaseModel):
     timestamp_key: str = "_transfer_timestamp"
     timestamp: datetime = Field(default_factory=datetime.now)
     overwrite_target: bool = False
-
-    def __hash__(self):
-        return hash((type(self),) + tuple(self.dict().items()))
+    page_size: PositiveInt = 10_000
+    batch_size: PositiveInt = 1_000
+    max_workers: PositiveInt = 8
+
+    # Source query text and parameters are derived on access rather than cached on the instance.
+    # model_copy(update=...) and in place edits of the list fields would otherwise leave them stale
+
+    @property
+    def endpoint_record_keys(self) -> tuple[str, str]:
+        """Relationship record keys holding the source and target node element ids"""
+        return f"_from_{self.element_id_key}", f"_to_{self.element_id_key}"
+
+    @property
+    def query_params(self) -> dict:
+        """Parameters shared by every source query of a transfer"""
+        return {
+            "labels": self.node_labels,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+    @property
+    def node_queries(self) -> list[tuple[str, str]]:
+        """(label, query) pairs returning upload ready node records of each label from source"""
+
+        # Shape upload ready records server side instead of copying each node in Python
+        if self.should_append_data:
+            projection = f"n{{.*, {safe_label(self.element_id_key)}: elementId(n), {safe_label(self.timestamp_key)}: $timestamp}}"
+        else:
+            projection = "properties(n)"
+
+        # A label listed twice is read once, concurrent uploads of the same label could MERGE duplicate nodes
+        return [
+            (label, f"MATCH (n:{safe_label(label)}) RETURN {projection} AS record")
+            for label in dict.fromkeys(self.node_labels)
+        ]
+
+    @property
+    def relationship_projection(self) -> str:
+        """Cypher map entries added to a source relationship `r` between `n` and `n2` for upload"""
+
+        # Required data to connect relationships with source and target nodes
+        from_key, to_key = self.endpoint_record_keys
+        projection = (
+            f"{safe_label(from_key)}: elementId(n), {safe_label(to_key)}: elementId(n2)"
+        )
+        if self.should_append_data:
+            # Add default transfer related data
+            projection += f", {safe_label(self.element_id_key)}: elementId(r), {safe_label(self.timestamp_key)}: $timestamp"
+        return projection
+
+    @property
+    def relationship_matches(self) -> dict[str, str]:
+        """MATCH clause binding each relationship type's `r` between transferred nodes `n` and `n2`, with their first transferred label as `from_label` and `to_label`"""
+
+        # A typed pattern scans only that relationship type instead of filtering every relationship by type(r)
+        matches = {}
+        for type in self.relationship_types:
+            matches[type] = f"""
+                MATCH (n)-[r:{safe_label(type)}]->(n2)
+                WITH n, r, n2,
+                    [label IN labels(n) WHERE label IN $labels][0] AS from_label,
+                    [label IN labels(n2) WHERE label IN $labels][0] AS to_label
+                WHERE from_label IS NOT NULL AND to_label IS NOT NULL
+                """
+        return matches
+
+    @property
+    def relationship_queries(self) -> list[tuple[str, str]]:
+        """(type, query) pairs streaming `from_label`, `to_label` and an upload ready `record` for each relationship of each type from source"""
+        matches = self.relationship_matches
+        projection = self.relationship_projection
+        return [
+            (
+                type,
+                f"{matches[type]} RETURN from_label, to_label, r{{.*, {projection}}} AS record",
+            )
+            for type in self.relationship_types
+        ]
+
+    @property
+    def relationship_group_queries(self) -> list[tuple[str, str]]:
+        """(type, query) pairs returning `from_label`, `to_label` and the upload ready `records` of each endpoint label pair of each type from source"""
+
+        # Records are grouped by their endpoint labels server side, so only one row per label pair is returned
+        matches = self.relationship_matches
+        projection = self.relationship_projection
+        return [
+            (
+                type,
+                f"{matches[type]} RETURN from_label, to_label, collect(r{{.*, {projection}}}) AS records",
+            )
+            for type in self.relationship_types
+        ]
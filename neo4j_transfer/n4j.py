@@ -1,17 +1,129 @@
-from neo4j import GraphDatabase
+from neo4j import (
+    READ_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    Driver,
+    GraphDatabase,
+)
 from neo4j_transfer.models import Neo4jCredentials
+from neo4j_transfer._cypher import safe_label
+import atexit
+import threading
+
+# Drivers are thread safe and pool their connections, so one is shared per set of credentials
+_drivers: dict[tuple[str, str, str], Driver] = {}
+_drivers_lock = threading.Lock()
+
+
+def _driver_key(creds: Neo4jCredentials) -> tuple[str, str, str]:
+    return (creds.uri, creds.username, creds.password)
+
+
+def get_driver(creds: Neo4jCredentials) -> Driver:
+    # Returns a cached driver, do not close it. See close_drivers()
+    key = _driver_key(creds)
+    with _drivers_lock:
+        driver = _drivers.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(
+                creds.uri, auth=(creds.username, creds.password)
+            )
+            _drivers[key] = driver
+        return driver
+
+
+@atexit.register
+def close_drivers():
+    # Closes every cached driver. Later calls open new ones as needed
+    with _drivers_lock:
+        drivers = list(_drivers.values())
+        _drivers.clear()
+    for driver in drivers:
+        driver.close()
 
 
 def validate_credentials(creds: Neo4jCredentials):
-    with GraphDatabase.driver(
-        creds.uri, auth=(creds.username, creds.password)
-    ) as driver:
+    # A driver that fails verification is closed and evicted, so bad credentials never stay cached
+    driver = get_driver(creds)
+    try:
         driver.verify_connectivity()
+    except Exception:
+        with _drivers_lock:
+            if _drivers.get(_driver_key(creds)) is driver:
+                del _drivers[_driver_key(creds)]
+        driver.close()
+        raise
 
 
 def execute_query(creds: Neo4jCredentials, query, params={}):
     # Returns a tuple of records, summary, keys
-    with GraphDatabase.driver(
-        creds.uri, auth=(creds.username, creds.password)
-    ) as driver:
-        return driver.execute_query(query, params, database=creds.database)
+    return get_driver(creds).execute_query(query, params, database=creds.database)
+
+
+def execute_write_batches(creds: Neo4jCredentials, queries: list[tuple[str, dict]]):
+    # Runs every (query, params) pair in one managed write transaction, retried by the driver on transient errors. Returns one summary per query
+    def work(tx):
+        return [tx.run(query, params).consume() for query, params in queries]
+
+    with get_driver(creds).session(database=creds.database) as session:
+        return session.execute_write(work)
+
+
+def run_query(creds: Neo4jCredentials, query, params={}):
+    # Runs in an auto-commit transaction, required by CALL { ... } IN TRANSACTIONS. Returns the summary
+    with get_driver(creds).session(database=creds.database) as session:
+        return session.run(query, params).consume()
+
+
+def execute_query_stream(
+    creds: Neo4jCredentials,
+    query,
+    params={},
+    fetch_size: int = 1000,
+):
+    # Yields records as the driver fetches them, fetch_size records per round-trip, instead of buffering the whole result
+    with get_driver(creds).session(
+        database=creds.database,
+        default_access_mode=READ_ACCESS,
+        fetch_size=fetch_size,
+    ) as session:
+        yield from session.run(query, params)
+
+
+def get_async_driver(creds: Neo4jCredentials) -> AsyncDriver:
+    # Async drivers are bound to the event loop they were used in, so they are not cached. Close it when done
+    return AsyncGraphDatabase.driver(creds.uri, auth=(creds.username, creds.password))
+
+
+async def execute_query_stream_async(
+    driver: AsyncDriver,
+    creds: Neo4jCredentials,
+    query,
+    params={},
+    fetch_size: int = 1000,
+):
+    # Async version of execute_query_stream, yields records as the driver fetches them
+    async with driver.session(
+        database=creds.database,
+        default_access_mode=READ_ACCESS,
+        fetch_size=fetch_size,
+    ) as session:
+        result = await session.run(query, params)
+        async for record in result:
+            yield record
+
+
+def reset_database(creds: Neo4jCredentials, batch_size: int = 50_000):
+    # Drops all constraints then deletes every node and relationship in server side batches. Returns the delete summary
+    records, _, _ = execute_query(creds, "SHOW CONSTRAINTS YIELD name")
+    for record in records:
+        execute_query(creds, f"DROP CONSTRAINT {safe_label(record['name'])} IF EXISTS")
+
+    query = """
+    MATCH (n)
+    CALL {
+        WITH n
+        DETACH DELETE n
+    } IN TRANSACTIONS OF $batch_size ROWS
+    """
+    return run_query(creds, query, {"batch_size": batch_size})
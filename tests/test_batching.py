@@ -0,0 +1,58 @@
+import pytest
+
+from neo4j_transfer._batching import AdaptiveBatcher
+
+
+def test_grows_while_writes_are_fast():
+    batcher = AdaptiveBatcher(1_000, target_ms=2000)
+    batcher.record(0.1)
+    assert batcher.size == 1_200
+    batcher.record(0.1)
+    assert batcher.size == 1_440
+
+
+def test_small_sizes_still_grow():
+    batcher = AdaptiveBatcher(3)
+    for _ in range(5):
+        batcher.record(0.001)
+    assert batcher.size > 3
+
+
+def test_halves_when_writes_are_slow():
+    batcher = AdaptiveBatcher(8_000, target_ms=2000)
+    batcher.record(10)
+    assert batcher.size == 4_000
+
+
+def test_holds_size_near_target():
+    batcher = AdaptiveBatcher(5_000, target_ms=2000)
+    batcher.record(2)
+    assert batcher.size == 5_000
+
+
+def test_average_smooths_a_single_outlier():
+    batcher = AdaptiveBatcher(5_000, target_ms=2000)
+    batcher.record(2)
+    batcher.record(4)
+    # 0.2 * 4000 + 0.8 * 2000 = 2400ms, within 1.5x of the target
+    assert batcher.ewma_ms == pytest.approx(2400)
+    assert batcher.size == 5_000
+
+
+def test_clamped_to_bounds():
+    batcher = AdaptiveBatcher(150_000, min_size=1_000, max_size=200_000)
+    for _ in range(10):
+        batcher.record(0.001)
+    assert batcher.size == 200_000
+
+    for _ in range(100):
+        batcher.record(100)
+    assert batcher.size == 1_000
+
+
+def test_initial_size_outside_bounds_widens_them():
+    batcher = AdaptiveBatcher(10, min_size=1_000)
+    assert batcher.min_size == 10
+    for _ in range(10):
+        batcher.record(100)
+    assert batcher.size == 10
@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from neo4j_transfer._pipeline import prefetched
+
+
+def test_yields_items_in_order():
+    assert list(prefetched(range(100), maxsize=3)) == list(range(100))
+
+
+def test_empty_iterable():
+    assert list(prefetched([])) == []
+
+
+def test_reraises_producer_error_after_earlier_items():
+    def produce():
+        yield 1
+        yield 2
+        raise ValueError("source failed")
+
+    received = []
+    with pytest.raises(ValueError, match="source failed"):
+        for item in prefetched(produce()):
+            received.append(item)
+    assert received == [1, 2]
+
+
+def test_early_close_closes_source_and_stops_producer():
+    closed = threading.Event()
+    produced = []
+
+    def produce():
+        try:
+            for i in range(1_000):
+                produced.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    items = prefetched(produce(), maxsize=2)
+    assert next(items) == 0
+    items.close()
+
+    assert closed.wait(timeout=5)
+    # The producer stops within a few items of maxsize rather than draining the source
+    assert len(produced) < 10
+
+
+def test_non_iterable_raises_to_caller():
+    with pytest.raises(TypeError):
+        next(prefetched(5))
@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import pytest
+from neo4j_uploader.models import Nodes, Relationships, TargetNode
+
+import neo4j_transfer
+from neo4j_transfer import Neo4jCredentials, upload_native
+
+CREDS = Neo4jCredentials(uri="bolt://localhost:7687", password="password")
+
+
+def _summary(rows: list[dict], nodes: bool) -> SimpleNamespace:
+    return SimpleNamespace(
+        counters=SimpleNamespace(
+            nodes_created=len(rows) if nodes else 0,
+            relationships_created=0 if nodes else len(rows),
+            properties_set=0,
+        )
+    )
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record every write upload_native sends instead of running it"""
+    calls = {"payloads": [], "transactions": []}
+
+    def run_query(creds, query, params={}):
+        calls["payloads"].append(params["rows"])
+        return _summary(params["rows"], nodes=True)
+
+    def execute_write_batches(creds, queries):
+        batches = [params["rows"] for _, params in queries]
+        calls["transactions"].append(batches)
+        return [_summary(rows, nodes=False) for rows in batches]
+
+    monkeypatch.setattr(neo4j_transfer, "run_query", run_query)
+    monkeypatch.setattr(neo4j_transfer, "execute_write_batches", execute_write_batches)
+    monkeypatch.setattr(neo4j_transfer, "create_node_indexes", lambda *args: None)
+    monkeypatch.setattr(neo4j_transfer, "reset_database", lambda *args: None)
+    return calls
+
+
+def _relationships(records: list[dict]) -> Relationships:
+    return Relationships(
+        type="R",
+        from_node=TargetNode(node_label="A", node_key="eid", record_key="_from"),
+        to_node=TargetNode(node_label="A", node_key="eid", record_key="_to"),
+        records=records,
+    )
+
+
+def test_partitions_keep_each_start_node_on_one_worker(writes):
+    records = [{"_from": f"n{i % 5}", "_to": "m", "i": i} for i in range(40)]
+
+    result = upload_native(
+        CREDS,
+        [],
+        [_relationships(records)],
+        batch_size=3,
+        max_workers=2,
+        payload_size=6,
+    )
+
+    batches = [batch for transaction in writes["transactions"] for batch in transaction]
+    assert sorted(row["i"] for batch in batches for row in batch) == list(range(40))
+    assert all(len(batch) <= 3 for batch in batches)
+    # Consecutive batches of a partition share a transaction up to payload_size records
+    assert all(len(transaction) <= 2 for transaction in writes["transactions"])
+
+    # Every transaction holds rows of a single worker's start node partition
+    for transaction in writes["transactions"]:
+        partitions = {hash(row["_from"]) % 2 for batch in transaction for row in batch}
+        assert len(partitions) == 1
+
+    assert result.relationships_created == 40
+    assert result.records_total == len(batches)
+    assert result.records_completed == len(batches)
+    assert result.was_successful
+
+
+def test_node_payloads_and_accounting(writes):
+    nodes = [
+        Nodes(labels=["A"], key="eid", records=[{"eid": i} for i in range(5)]),
+        Nodes(labels=["B"], key="eid", records=[]),
+    ]
+
+    result = upload_native(CREDS, nodes, [], batch_size=2, payload_size=4)
+
+    assert [len(payload) for payload in writes["payloads"]] == [4, 1]
+    assert result.nodes_created == 5
+    assert result.records_total == 2
+    assert result.records_completed == 2
+    assert result.was_successful
+
+
+def test_failed_batch_reports_its_index(writes, monkeypatch):
+    def run_query(creds, query, params={}):
+        if params["rows"][0]["eid"] == 2:
+            raise RuntimeError("boom")
+        return _summary(params["rows"], nodes=True)
+
+    monkeypatch.setattr(neo4j_transfer, "run_query", run_query)
+    nodes = [Nodes(labels=["A"], key="eid", records=[{"eid": i} for i in range(3)])]
+
+    result = upload_native(CREDS, nodes, [], batch_size=1, payload_size=1)
+
+    assert result.records_total == 3
+    assert result.records_completed == 2
+    assert "Error processing batch 3 of 3: boom." in result.error_message
+    assert not result.was_successful
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"max_workers": 0}])
+def test_rejects_non_positive_sizes(kwargs):
+    with pytest.raises(ValueError):
+        upload_native(CREDS, [], [], **kwargs)
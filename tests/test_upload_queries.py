@@ -0,0 +1,117 @@
+from neo4j_uploader.models import Nodes, Relationships, TargetNode
+
+from neo4j_transfer import (
+    TransferSpec,
+    _node_rows,
+    _node_upload_query,
+    _RelationshipBatches,
+    _relationship_upload_query,
+)
+
+
+def _query(query: str) -> str:
+    return " ".join(query.split())
+
+
+def _relationships(**kwargs) -> Relationships:
+    return Relationships(
+        type="KNOWS",
+        from_node=TargetNode(node_label="A", node_key="eid", record_key="_from"),
+        to_node=TargetNode(node_label="B", node_key="eid", record_key="_to"),
+        records=[],
+        **kwargs,
+    )
+
+
+def test_node_query_merges_on_key_when_deduping():
+    query = _query(_node_upload_query(Nodes(labels=["A", "B"], key="eid", records=[])))
+    assert "MERGE (n:`A`:`B` {`eid`: row.`eid`}) SET n += row" in query
+    assert "IN TRANSACTIONS" not in query
+
+
+def test_node_query_creates_without_dedupe():
+    nodes = Nodes(labels=["A"], key="eid", records=[], dedupe=False)
+    query = _query(_node_upload_query(nodes))
+    assert "CREATE (n:`A`) SET n += row" in query
+    assert "MERGE" not in query
+
+
+def test_node_query_in_transactions():
+    nodes = Nodes(labels=["A"], key="eid", records=[])
+    query = _query(_node_upload_query(nodes, in_transactions=True))
+    assert query.startswith("UNWIND $rows AS row CALL { WITH row MERGE")
+    assert query.endswith("} IN TRANSACTIONS OF $batch_size ROWS")
+
+
+def test_node_rows_drop_excluded_keys():
+    records = [{"eid": 1, "name": "a", "secret": "x"}]
+    nodes = Nodes(labels=["A"], key="eid", records=records, exclude_keys=["secret"])
+    assert _node_rows(nodes) == [{"eid": 1, "name": "a"}]
+
+
+def test_node_rows_without_exclusions_are_sent_as_is():
+    nodes = Nodes(labels=["A"], key="eid", records=[{"eid": 1}])
+    assert _node_rows(nodes) is nodes.records
+
+
+def test_relationship_query_matches_endpoints_on_record_keys():
+    query = _query(_relationship_upload_query(_relationships()))
+    assert "MATCH (a:`A` {`eid`: row.`_from`})" in query
+    assert "MATCH (b:`B` {`eid`: row.`_to`})" in query
+    assert "MERGE (a)-[r:`KNOWS`]->(b)" in query
+
+
+def test_relationship_query_creates_without_dedupe():
+    query = _query(_relationship_upload_query(_relationships(dedupe=False)))
+    assert "CREATE (a)-[r:`KNOWS`]->(b)" in query
+    assert "MERGE" not in query
+
+
+def test_relationship_query_nulls_auto_excluded_endpoint_keys():
+    query = _query(_relationship_upload_query(_relationships()))
+    assert "SET r += row{.*, `_from`: null, `_to`: null}" in query
+
+
+def test_relationship_query_unions_exclude_keys_with_auto_excluded_keys():
+    rels = _relationships(exclude_keys=["secret", "_from"])
+    query = _query(_relationship_upload_query(rels))
+    assert "SET r += row{.*, `secret`: null, `_from`: null, `_to`: null}" in query
+
+
+def test_relationship_query_without_exclusions_sets_the_whole_row():
+    query = _query(_relationship_upload_query(_relationships(auto_exclude_keys=False)))
+    assert query.endswith("SET r += row")
+
+
+def test_relationship_batches_yield_full_batches_per_label_pair():
+    batches = _RelationshipBatches(TransferSpec(node_labels=["A", "B"]))
+    assert batches.add("R", "A", "B", {"i": 1}, 2) is None
+    assert batches.add("R", "A", "A", {"i": 2}, 2) is None
+
+    full = batches.add("R", "A", "B", {"i": 3}, 2)
+    assert full.type == "R"
+    assert (full.from_node.node_label, full.to_node.node_label) == ("A", "B")
+    assert full.records == [{"i": 1}, {"i": 3}]
+
+
+def test_relationship_batches_flush_leftovers_in_first_seen_order():
+    batches = _RelationshipBatches(TransferSpec(node_labels=["A", "B"]))
+    batches.add("R", "B", "A", {"i": 1}, 10)
+    batches.add("R", "A", "B", {"i": 2}, 10)
+    batches.add("R", "B", "A", {"i": 3}, 10)
+
+    flushed = batches.flush("R")
+    assert [(r.from_node.node_label, r.to_node.node_label) for r in flushed] == [
+        ("B", "A"),
+        ("A", "B"),
+    ]
+    assert [r.records for r in flushed] == [[{"i": 1}, {"i": 3}], [{"i": 2}]]
+    assert batches.flush("R") == []
+
+
+def test_relationship_batches_share_endpoint_specs_per_pair():
+    batches = _RelationshipBatches(TransferSpec(node_labels=["A", "B"]))
+    first = batches.relationships("R", "A", "B", [])
+    second = batches.relationships("S", "A", "B", [])
+    assert first.from_node is second.from_node
+    assert first.to_node is second.to_node